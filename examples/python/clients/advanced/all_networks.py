@@ -12,18 +12,10 @@ import os
 import sys
 
 from dotenv import load_dotenv
-from eth_account import Account
 
 from x402 import x402Client
 from x402.http import x402HTTPClient
 from x402.http.clients import x402HttpxClient
-from x402.mechanisms.evm import EthAccountSigner
-from x402.mechanisms.evm.exact.register import register_exact_evm_client
-from x402.mechanisms.svm import KeypairSigner
-from x402.mechanisms.svm.exact.register import register_exact_svm_client
-
-# Load environment variables
-load_dotenv()
 
 
 def validate_environment() -> tuple[str | None, str | None, str, str]:
@@ -59,20 +51,30 @@ def validate_environment() -> tuple[str | None, str | None, str, str]:
 
 async def main() -> None:
     """Main entry point demonstrating httpx with x402 payments."""
+    load_dotenv()
     # Validate environment
     evm_private_key, svm_private_key, base_url, endpoint_path = validate_environment()
 
     # Create x402 client
     client = x402Client()
 
-    # Register EVM payment scheme if private key provided
+    # Register EVM payment scheme if private key provided. Chain SDKs are
+    # imported only for the networks that are configured.
     if evm_private_key:
+        from eth_account import Account
+
+        from x402.mechanisms.evm import EthAccountSigner
+        from x402.mechanisms.evm.exact.register import register_exact_evm_client
+
         account = Account.from_key(evm_private_key)
         register_exact_evm_client(client, EthAccountSigner(account))
         print(f"Initialized EVM account: {account.address}")
 
     # Register SVM payment scheme if private key provided
     if svm_private_key:
+        from x402.mechanisms.svm import KeypairSigner
+        from x402.mechanisms.svm.exact.register import register_exact_svm_client
+
         svm_signer = KeypairSigner.from_base58(svm_private_key)
         register_exact_svm_client(client, svm_signer)
         print(f"Initialized SVM account: {svm_signer.address}")
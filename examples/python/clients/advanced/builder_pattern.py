@@ -12,9 +12,11 @@ Use this approach when you need:
 import asyncio
 import os
 import sys
+from dataclasses import dataclass
 
 from dotenv import load_dotenv
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 
 from x402 import x402Client
 from x402.http import x402HTTPClient
@@ -22,7 +24,28 @@ from x402.http.clients import x402HttpxClient
 from x402.mechanisms.evm import EthAccountSigner
 from x402.mechanisms.evm.exact import ExactEvmScheme
 
-load_dotenv()
+
+@dataclass(frozen=True, slots=True)
+class Env:
+    """Example configuration, read from the environment once."""
+
+    private_key: str | None
+    mainnet_key: str | None  # Optional: separate mainnet key
+    testnet_key: str | None  # Optional: separate testnet key
+    base_url: str
+    endpoint_path: str
+
+    @classmethod
+    def from_environ(cls) -> "Env":
+        """Read all example settings from the environment."""
+        env = os.environ
+        return cls(
+            private_key=env.get("EVM_PRIVATE_KEY"),
+            mainnet_key=env.get("MAINNET_PRIVATE_KEY"),
+            testnet_key=env.get("TESTNET_PRIVATE_KEY"),
+            base_url=env.get("RESOURCE_SERVER_URL", "http://localhost:4021"),
+            endpoint_path=env.get("ENDPOINT_PATH", "/weather"),
+        )
 
 
 async def run_builder_pattern_example(
@@ -41,30 +64,39 @@ async def run_builder_pattern_example(
     """
     print("🔧 Creating client with builder pattern...\n")
 
-    # Create accounts - in production, you might use different keys per network
-    default_account = Account.from_key(private_key)
-    mainnet_account = Account.from_key(mainnet_key) if mainnet_key else default_account
-    testnet_account = Account.from_key(testnet_key) if testnet_key else default_account
+    # Create accounts - in production, you might use different keys per network.
+    # Each distinct key is derived once; repeated keys share the same account.
+    accounts: dict[str, LocalAccount] = {}
+
+    def account_for(key: str) -> LocalAccount:
+        if key not in accounts:
+            accounts[key] = Account.from_key(key)
+        return accounts[key]
+
+    default_account = account_for(private_key)
+    mainnet_account = account_for(mainnet_key or private_key)
+    testnet_account = account_for(testnet_key or private_key)
 
-    # Create signers for different networks
-    default_signer = EthAccountSigner(default_account)
-    mainnet_signer = EthAccountSigner(mainnet_account)
-    testnet_signer = EthAccountSigner(testnet_account)
+    # Create one scheme per signer - schemes are stateless wrappers around
+    # their signer, so the same instance can back several networks
+    default_scheme = ExactEvmScheme(EthAccountSigner(default_account))
+    mainnet_scheme = ExactEvmScheme(EthAccountSigner(mainnet_account))
+    testnet_scheme = ExactEvmScheme(EthAccountSigner(testnet_account))
 
     # Builder pattern allows fine-grained control over network registration
     # More specific patterns take precedence over wildcards
     client = (
         x402Client()
         # Wildcard: All EVM networks (fallback)
-        .register("eip155:*", ExactEvmScheme(default_signer))
+        .register("eip155:*", default_scheme)
         # Specific: Ethereum mainnet with dedicated signer
-        .register("eip155:1", ExactEvmScheme(mainnet_signer))
+        .register("eip155:1", mainnet_scheme)
         # Specific: Base mainnet
-        .register("eip155:8453", ExactEvmScheme(mainnet_signer))
+        .register("eip155:8453", mainnet_scheme)
         # Specific: Base Sepolia testnet with testnet signer
-        .register("eip155:84532", ExactEvmScheme(testnet_signer))
+        .register("eip155:84532", testnet_scheme)
         # Specific: Sepolia testnet
-        .register("eip155:11155111", ExactEvmScheme(testnet_signer))
+        .register("eip155:11155111", testnet_scheme)
     )
 
     print("Registered networks:")
@@ -104,19 +136,16 @@ async def run_builder_pattern_example(
 
 async def main() -> None:
     """Main entry point."""
-    private_key = os.getenv("EVM_PRIVATE_KEY")
-    mainnet_key = os.getenv("MAINNET_PRIVATE_KEY")  # Optional: separate mainnet key
-    testnet_key = os.getenv("TESTNET_PRIVATE_KEY")  # Optional: separate testnet key
-    base_url = os.getenv("RESOURCE_SERVER_URL", "http://localhost:4021")
-    endpoint_path = os.getenv("ENDPOINT_PATH", "/weather")
+    load_dotenv()
+    env = Env.from_environ()
 
-    if not private_key:
+    if not env.private_key:
         print("Error: EVM_PRIVATE_KEY environment variable is required")
         print("Please copy .env-local to .env and fill in the values.")
         sys.exit(1)
 
-    url = f"{base_url}{endpoint_path}"
-    await run_builder_pattern_example(private_key, url, mainnet_key, testnet_key)
+    url = f"{env.base_url}{env.endpoint_path}"
+    await run_builder_pattern_example(env.private_key, url, env.mainnet_key, env.testnet_key)
 
 
 if __name__ == "__main__":
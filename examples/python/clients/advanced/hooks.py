@@ -32,8 +32,6 @@ from x402.schemas import (
     PaymentCreationFailureContext,
 )
 
-load_dotenv()
-
 
 async def before_payment_creation_hook(
     context: PaymentCreationContext,
@@ -134,6 +132,7 @@ async def run_hooks_example(private_key: str, url: str) -> None:
 
 async def main() -> None:
     """Main entry point."""
+    load_dotenv()
     private_key = os.getenv("EVM_PRIVATE_KEY")
     base_url = os.getenv("RESOURCE_SERVER_URL", "http://localhost:4021")
     endpoint_path = os.getenv("ENDPOINT_PATH", "/weather")
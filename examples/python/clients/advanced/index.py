@@ -18,19 +18,7 @@ import argparse
 import asyncio
 import os
 import sys
-
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-
-EXAMPLES = {
-    "all_networks": "All supported networks with optional chain configuration",
-    "hooks": "Payment lifecycle hooks - before, after, failure callbacks",
-    "preferred_network": "Custom network preference selector",
-    "builder_pattern": "Network-specific registration with builder pattern",
-}
+from collections.abc import Awaitable, Callable
 
 
 def validate_environment() -> tuple[str, str]:
@@ -82,11 +70,24 @@ async def run_builder_pattern_example(private_key: str, url: str) -> None:
     await run_builder_pattern_example(private_key, url)
 
 
-EXAMPLE_RUNNERS = {
-    "all_networks": run_all_networks_example,
-    "hooks": run_hooks_example,
-    "preferred_network": run_preferred_network_example,
-    "builder_pattern": run_builder_pattern_example,
+# Example name -> (description, runner)
+EXAMPLES: dict[str, tuple[str, Callable[[str, str], Awaitable[None]]]] = {
+    "all_networks": (
+        "All supported networks with optional chain configuration",
+        run_all_networks_example,
+    ),
+    "hooks": (
+        "Payment lifecycle hooks - before, after, failure callbacks",
+        run_hooks_example,
+    ),
+    "preferred_network": (
+        "Custom network preference selector",
+        run_preferred_network_example,
+    ),
+    "builder_pattern": (
+        "Network-specific registration with builder pattern",
+        run_builder_pattern_example,
+    ),
 }
 
 
@@ -98,12 +99,13 @@ async def run_example(name: str, private_key: str, url: str) -> None:
         private_key: EVM private key for signing.
         url: URL to make the request to.
     """
+    description, runner = EXAMPLES[name]
+
     print(f"\n{'=' * 60}")
     print(f"Running: {name}")
-    print(f"Description: {EXAMPLES[name]}")
+    print(f"Description: {description}")
     print(f"{'=' * 60}\n")
 
-    runner = EXAMPLE_RUNNERS[name]
     await runner(private_key, url)
 
 
@@ -140,7 +142,7 @@ Available examples:
         "example",
         nargs="?",
         default="hooks",
-        choices=[*EXAMPLES.keys(), "all"],
+        choices=(*EXAMPLES, "all"),
         help="Example to run (default: hooks)",
     )
     parser.add_argument(
@@ -153,11 +155,16 @@ Available examples:
 
     if args.list:
         print("Available examples:\n")
-        for name, desc in EXAMPLES.items():
+        for name, (desc, _) in EXAMPLES.items():
             print(f"  {name:20} {desc}")
         print(f"\n  {'all':20} Run all examples sequentially")
         return
 
+    # Only load .env once we know an example will actually run
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     private_key, url = validate_environment()
 
     if args.example == "all":
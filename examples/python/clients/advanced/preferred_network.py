@@ -27,8 +27,6 @@ from x402.mechanisms.svm import KeypairSigner, SOLANA_MAINNET_CAIP2, SOLANA_DEVN
 from x402.mechanisms.svm.exact.register import register_exact_svm_client
 from x402.schemas import PaymentRequirements, PaymentRequirementsV1
 
-load_dotenv()
-
 # Type alias for requirements
 RequirementsView = PaymentRequirements | PaymentRequirementsV1
 
@@ -141,6 +139,7 @@ async def run_preferred_network_example(
 
 async def main() -> None:
     """Main entry point."""
+    load_dotenv()
     evm_private_key = os.getenv("EVM_PRIVATE_KEY")
     svm_private_key = os.getenv("SVM_PRIVATE_KEY")
     base_url = os.getenv("RESOURCE_SERVER_URL", "http://localhost:4021")
@@ -10,111 +10,179 @@ Supports:
 Run with: uvicorn main:app --port 4022
 """
 
+import hashlib
+import logging
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Annotated, Any
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from solders.keypair import Keypair
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import BaseModel, Discriminator, Tag
 
 from x402 import x402Facilitator
-from x402.mechanisms.evm import FacilitatorWeb3Signer
-from x402.mechanisms.evm.exact import register_exact_evm_facilitator
-from x402.mechanisms.svm import FacilitatorKeypairSigner
-from x402.mechanisms.svm.exact import register_exact_svm_facilitator
+from x402.schemas import (
+    PaymentPayload,
+    PaymentPayloadV1,
+    PaymentRequirements,
+    SettleResponse,
+    SupportedResponse,
+    VerifyResponse,
+)
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
 PORT = int(os.environ.get("PORT", "4022"))
+EVM_PRIVATE_KEY = os.environ.get("EVM_PRIVATE_KEY")
+SVM_PRIVATE_KEY = os.environ.get("SVM_PRIVATE_KEY")
 
-# Validate required environment variables
-if not os.environ.get("EVM_PRIVATE_KEY"):
-    print("❌ EVM_PRIVATE_KEY environment variable is required")
-    sys.exit(1)
+# Logging
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
 
-if not os.environ.get("SVM_PRIVATE_KEY"):
-    print("❌ SVM_PRIVATE_KEY environment variable is required")
+# Validate required environment variables
+if not EVM_PRIVATE_KEY and not SVM_PRIVATE_KEY:
+    logger.error("❌ At least one of EVM_PRIVATE_KEY or SVM_PRIVATE_KEY is required")
     sys.exit(1)
 
-# Initialize the EVM signer from private key
-evm_signer = FacilitatorWeb3Signer(
-    private_key=os.environ["EVM_PRIVATE_KEY"],
-    rpc_url=os.environ.get("EVM_RPC_URL", "https://sepolia.base.org"),
-)
-print(f"EVM Facilitator account: {evm_signer.get_addresses()[0]}")
-
-# Initialize the SVM signer from private key
-svm_keypair = Keypair.from_base58_string(os.environ["SVM_PRIVATE_KEY"])
-svm_signer = FacilitatorKeypairSigner(svm_keypair)
-print(f"SVM Facilitator account: {svm_signer.get_addresses()[0]}")
-
 
 # Async hook functions for the facilitator
 async def before_verify_hook(ctx):
-    print(f"Before verify: {ctx.payment_payload}")
+    logger.info("Before verify: %s", ctx.payment_payload)
 
 
 async def after_verify_hook(ctx):
-    print(f"After verify: {ctx.result}")
+    logger.info("After verify: %s", ctx.result)
 
 
 async def verify_failure_hook(ctx):
-    print(f"Verify failure: {ctx.error}")
+    logger.warning("Verify failure: %s", ctx.error)
 
 
 async def before_settle_hook(ctx):
-    print(f"Before settle: {ctx.payment_payload}")
+    logger.info("Before settle: %s", ctx.payment_payload)
 
 
 async def after_settle_hook(ctx):
-    print(f"After settle: {ctx.result}")
+    logger.info("After settle: %s", ctx.result)
 
 
 async def settle_failure_hook(ctx):
-    print(f"Settle failure: {ctx.error}")
-
-
-# Initialize the x402 Facilitator with EVM and SVM support
-facilitator = (
-    x402Facilitator()
-    .on_before_verify(before_verify_hook)
-    .on_after_verify(after_verify_hook)
-    .on_verify_failure(verify_failure_hook)
-    .on_before_settle(before_settle_hook)
-    .on_after_settle(after_settle_hook)
-    .on_settle_failure(settle_failure_hook)
-)
+    logger.warning("Settle failure: %s", ctx.error)
+
+
+# The facilitator and its signers are built on first use (server startup, see
+# below) rather than at import time, so importing this module does no signer
+# setup or chain SDK work.
+@lru_cache(maxsize=1)
+def get_facilitator() -> x402Facilitator:
+    """Build the x402 Facilitator with EVM and/or SVM support."""
+    facilitator = (
+        x402Facilitator()
+        .on_before_verify(before_verify_hook)
+        .on_after_verify(after_verify_hook)
+        .on_verify_failure(verify_failure_hook)
+        .on_before_settle(before_settle_hook)
+        .on_after_settle(after_settle_hook)
+        .on_settle_failure(settle_failure_hook)
+    )
+
+    # Register EVM and SVM schemes. Each chain SDK is only imported when its
+    # key is configured, so single-chain facilitators skip the other import tree.
+    if EVM_PRIVATE_KEY:
+        from x402.mechanisms.evm import FacilitatorWeb3Signer
+        from x402.mechanisms.evm.exact import register_exact_evm_facilitator
+
+        # Initialize the EVM signer from private key
+        evm_signer = FacilitatorWeb3Signer(
+            private_key=EVM_PRIVATE_KEY,
+            rpc_url=os.environ.get("EVM_RPC_URL", "https://sepolia.base.org"),
+        )
+        logger.info("EVM Facilitator account: %s", evm_signer.get_addresses()[0])
+
+        register_exact_evm_facilitator(
+            facilitator,
+            evm_signer,
+            networks="eip155:84532",  # Base Sepolia
+            deploy_erc4337_with_eip6492=True,
+        )
+
+    if SVM_PRIVATE_KEY:
+        from solders.keypair import Keypair
+
+        from x402.mechanisms.svm import FacilitatorKeypairSigner
+        from x402.mechanisms.svm.exact import register_exact_svm_facilitator
+
+        # Initialize the SVM signer from private key
+        svm_keypair = Keypair.from_base58_string(SVM_PRIVATE_KEY)
+        svm_signer = FacilitatorKeypairSigner(svm_keypair)
+        logger.info("SVM Facilitator account: %s", svm_signer.get_addresses()[0])
+
+        register_exact_svm_facilitator(
+            facilitator,
+            svm_signer,
+            networks="solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1",  # Devnet
+        )
+
+    return facilitator
+
+
+@lru_cache(maxsize=1)
+def get_supported_body() -> tuple[bytes, str]:
+    """Serialize /supported once, with its ETag.
+
+    Supported kinds are fixed once the schemes are registered, so the JSON
+    body never changes for the lifetime of the process.
+    """
+    supported = get_facilitator().get_supported()
+    body = supported.model_dump_json(by_alias=True, exclude_none=True).encode()
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _payload_version(value: Any) -> str | None:
+    """Pick the payload model from its x402Version (V1 or V2)."""
+    if isinstance(value, dict):
+        version = value.get("x402Version")
+    else:
+        version = getattr(value, "x402_version", None)
+    return str(version) if version is not None else None
 
-# Register EVM and SVM schemes
-register_exact_evm_facilitator(
-    facilitator,
-    evm_signer,
-    networks="eip155:84532",  # Base Sepolia
-    deploy_erc4337_with_eip6492=True,
-)
-register_exact_svm_facilitator(
-    facilitator,
-    svm_signer,
-    networks="solana:EtWTRABZaYq6iMfeYKouRu166VU2xqa1",  # Devnet
-)
+
+# Payload V1/V2 is resolved by pydantic-core while FastAPI parses the body,
+# so handlers receive validated models with no second validation pass
+AnyPaymentPayload = Annotated[
+    Annotated[PaymentPayload, Tag("2")] | Annotated[PaymentPayloadV1, Tag("1")],
+    Discriminator(_payload_version),
+]
 
 
 # Pydantic models for request/response
 class VerifyRequest(BaseModel):
     """Verify endpoint request body."""
 
-    paymentPayload: dict
-    paymentRequirements: dict
+    paymentPayload: AnyPaymentPayload
+    paymentRequirements: PaymentRequirements
 
 
 class SettleRequest(BaseModel):
     """Settle endpoint request body."""
 
-    paymentPayload: dict
-    paymentRequirements: dict
+    paymentPayload: AnyPaymentPayload
+    paymentRequirements: PaymentRequirements
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the facilitator before serving."""
+    get_facilitator()
+    get_supported_body()
+    yield
 
 
 # Initialize FastAPI app
@@ -122,11 +190,15 @@ app = FastAPI(
     title="x402 Facilitator",
     description="Verifies and settles x402 payments on-chain",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
 
-@app.post("/verify")
-async def verify(request: VerifyRequest):
+# Endpoints return x402 response models directly: with a declared response
+# model FastAPI serializes them via pydantic-core (camelCase aliases, None
+# fields dropped) instead of round-tripping through a Python dict.
+@app.post("/verify", response_model_exclude_none=True)
+async def verify(request: VerifyRequest, response: Response) -> VerifyResponse:
     """Verify a payment against requirements.
 
     Args:
@@ -135,24 +207,17 @@ async def verify(request: VerifyRequest):
     Returns:
         VerifyResponse with isValid and payer (if valid) or invalidReason.
     """
+    response.headers["Cache-Control"] = "no-store"
     try:
-        from x402.schemas import PaymentRequirements, parse_payment_payload
-
-        # Parse payload (auto-detects V1/V2) and requirements
-        payload = parse_payment_payload(request.paymentPayload)
-        requirements = PaymentRequirements.model_validate(request.paymentRequirements)
-
         # Verify payment (await async method)
-        response = await facilitator.verify(payload, requirements)
-
-        return response.model_dump(by_alias=True, exclude_none=True)
+        return await get_facilitator().verify(request.paymentPayload, request.paymentRequirements)
     except Exception as e:
-        print(f"Verify error: {e}")
+        logger.error("Verify error: %s", e)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.post("/settle")
-async def settle(request: SettleRequest):
+@app.post("/settle", response_model_exclude_none=True)
+async def settle(request: SettleRequest, response: Response) -> SettleResponse:
     """Settle a payment on-chain.
 
     Args:
@@ -161,52 +226,43 @@ async def settle(request: SettleRequest):
     Returns:
         SettleResponse with success, transaction, network, and payer.
     """
+    response.headers["Cache-Control"] = "no-store"
     try:
-        from x402.schemas import PaymentRequirements, parse_payment_payload
-
-        # Parse payload (auto-detects V1/V2) and requirements
-        payload = parse_payment_payload(request.paymentPayload)
-        requirements = PaymentRequirements.model_validate(request.paymentRequirements)
-
         # Settle payment (await async method)
-        response = await facilitator.settle(payload, requirements)
-
-        return response.model_dump(by_alias=True, exclude_none=True)
+        return await get_facilitator().settle(request.paymentPayload, request.paymentRequirements)
     except Exception as e:
-        print(f"Settle error: {e}")
+        logger.error("Settle error: %s", e)
 
         # Check if this was an abort from hook
         if "aborted" in str(e).lower():
-            from x402.schemas import SettleResponse
-
-            abort = SettleResponse(
+            return SettleResponse(
                 success=False,
                 error_reason=str(e),
-                network=request.paymentPayload.get("accepted", {}).get("network", "unknown"),
+                network=request.paymentRequirements.network,
                 transaction="",
             )
-            return abort.model_dump(by_alias=True, exclude_none=True)
 
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.get("/supported")
-async def supported():
+@app.get("/supported", response_model=SupportedResponse)
+async def supported(request: Request) -> Response:
     """Get supported payment kinds and extensions.
 
+    Serves the pre-serialized body with an ETag, answering 304 when the
+    client already has it.
+
     Returns:
         SupportedResponse with kinds, extensions, and signers.
     """
     try:
-        response = facilitator.get_supported()
-
-        return {
-            "kinds": [k.model_dump(by_alias=True, exclude_none=True) for k in response.kinds],
-            "extensions": response.extensions,
-            "signers": response.signers,
-        }
+        body, etag = get_supported_body()
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
     except Exception as e:
-        print(f"Supported error: {e}")
+        logger.error("Supported error: %s", e)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -219,5 +275,5 @@ async def health():
 if __name__ == "__main__":
     import uvicorn
 
-    print(f"Facilitator listening on port {PORT}")
+    logger.info("Facilitator listening on port %s", PORT)
     uvicorn.run(app, host="0.0.0.0", port=PORT)
@@ -1,6 +1,10 @@
 """Custom token/money parser example."""
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -24,6 +28,16 @@ if not EVM_ADDRESS:
     raise ValueError("Missing required EVM_ADDRESS environment variable")
 
 
+@lru_cache(maxsize=256)
+def to_wxdai_units(amount: float) -> str:
+    """Convert a dollar amount to WXDAI base units (18 decimals).
+
+    Goes through Decimal so amounts like 0.07 don't pick up binary float
+    error (0.07 * 1e18 == 70000000000000010.0).
+    """
+    return str(int(Decimal(str(amount)).scaleb(18)))
+
+
 def custom_money_parser(amount: float, network: str) -> AssetAmount | None:
     """Custom money parser for Gnosis Chain using Wrapped XDAI.
 
@@ -31,7 +45,7 @@ def custom_money_parser(amount: float, network: str) -> AssetAmount | None:
     """
     if network == "eip155:100":  # Gnosis Chain
         return AssetAmount(
-            amount=str(int(amount * 1e18)),
+            amount=to_wxdai_units(amount),
             asset="0xe91d153e0b41518a2ce8dd3d7944fa863463a97d",  # WXDAI
             extra={"token": "Wrapped XDAI"},
         )
@@ -47,7 +61,14 @@ class WeatherResponse(BaseModel):
     report: WeatherReport
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the facilitator's connection pool on shutdown."""
+    yield
+    await facilitator.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
@@ -1,6 +1,9 @@
 """Dynamic pay-to routing example."""
 
 import os
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -23,13 +26,15 @@ FACILITATOR_URL = os.getenv("FACILITATOR_URL", "https://x402.org/facilitator")
 if not EVM_ADDRESS:
     raise ValueError("Missing required EVM_ADDRESS environment variable")
 
-# Address lookup for dynamic pay-to
-ADDRESS_LOOKUP: dict[str, str] = {
-    "US": EVM_ADDRESS,
-    "UK": EVM_ADDRESS,
-    "CA": EVM_ADDRESS,
-    "AU": EVM_ADDRESS,
-}
+# Address lookup for dynamic pay-to (read-only once built)
+ADDRESS_LOOKUP: Mapping[str, str] = MappingProxyType(
+    {
+        "US": EVM_ADDRESS,
+        "UK": EVM_ADDRESS,
+        "CA": EVM_ADDRESS,
+        "AU": EVM_ADDRESS,
+    }
+)
 
 
 def get_dynamic_pay_to(context: HTTPRequestContext) -> str:
@@ -47,7 +52,14 @@ class WeatherResponse(BaseModel):
     report: WeatherReport
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the facilitator's connection pool on shutdown."""
+    yield
+    await facilitator.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
@@ -1,6 +1,8 @@
 """Dynamic pricing example."""
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -39,7 +41,14 @@ class WeatherResponse(BaseModel):
     report: WeatherReport
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the facilitator's connection pool on shutdown."""
+    yield
+    await facilitator.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 facilitator = HTTPFacilitatorClient(FacilitatorConfig(url=FACILITATOR_URL))
 server = x402ResourceServer(facilitator)
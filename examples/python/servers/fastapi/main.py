@@ -1,11 +1,13 @@
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from pydantic import BaseModel
 
 from x402.http import FacilitatorConfig, HTTPFacilitatorClient, PaymentOption
-from x402.http.middleware.fastapi import PaymentMiddlewareASGI, payment_middleware  # noqa: F401
+from x402.http.middleware.fastapi import PaymentMiddlewareASGI
 from x402.http.types import RouteConfig
 from x402.mechanisms.evm.exact import ExactEvmServerScheme
 from x402.mechanisms.svm.exact import ExactSvmServerScheme
@@ -39,8 +41,15 @@ class PremiumContentResponse(BaseModel):
     content: str
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the facilitator's connection pool on shutdown."""
+    yield
+    await facilitator.aclose()
+
+
 # App
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 # x402 Middleware
@@ -94,7 +103,6 @@ routes = {
     ),
 }
 app.add_middleware(PaymentMiddlewareASGI, routes=routes, server=server)
-# app.middleware("http")(payment_middleware(routes=routes, server=server))  # Alternative way to register the middleware
 
 
 # Routes
@@ -1,3 +1,4 @@
+import atexit
 import os
 
 from dotenv import load_dotenv
@@ -29,7 +30,10 @@ app = Flask(__name__)
 
 
 # x402 Middleware
+# The facilitator client keeps one pooled HTTP client, so verify/settle calls
+# reuse keep-alive connections; release them when the process exits
 facilitator = HTTPFacilitatorClientSync(FacilitatorConfig(url=FACILITATOR_URL))
+atexit.register(facilitator.close)
 server = x402ResourceServerSync(facilitator)
 server.register(EVM_NETWORK, ExactEvmServerScheme())
 server.register(SVM_NETWORK, ExactSvmServerScheme())
@@ -96,4 +100,5 @@ def get_premium_content():
 
 
 if __name__ == "__main__":
+    # Development server only; see the README for running under gunicorn
     app.run(host="0.0.0.0", port=4021, debug=False)
@@ -282,19 +282,19 @@ class x402ClientBase:
         # 1. Select requirements
         selected = self._select_requirements_v2(payment_required.accepts)
 
-        # 2. Build context
-        context = PaymentCreationContext(
-            payment_required=payment_required,
-            selected_requirements=selected,
-        )
-
-        # 3. Execute before hooks
-        for hook in self._before_payment_creation_hooks:
-            result = yield ("before", hook, context)
-            if isinstance(result, AbortResult):
-                from .schemas import PaymentAbortedError
+        # 2-3. Build context and execute before hooks (skipped when none are
+        # registered, which is the common case on the per-request path)
+        if self._before_payment_creation_hooks:
+            context = PaymentCreationContext(
+                payment_required=payment_required,
+                selected_requirements=selected,
+            )
+            for hook in self._before_payment_creation_hooks:
+                result = yield ("before", hook, context)
+                if isinstance(result, AbortResult):
+                    from .schemas import PaymentAbortedError
 
-                raise PaymentAbortedError(result.reason)
+                    raise PaymentAbortedError(result.reason)
 
         try:
             # 4. Find scheme client
@@ -330,13 +330,14 @@ class x402ClientBase:
             )
 
             # 7. Execute after hooks
-            result_context = PaymentCreatedContext(
-                payment_required=payment_required,
-                selected_requirements=selected,
-                payment_payload=payload,
-            )
-            for hook in self._after_payment_creation_hooks:
-                yield ("after", hook, result_context)
+            if self._after_payment_creation_hooks:
+                result_context = PaymentCreatedContext(
+                    payment_required=payment_required,
+                    selected_requirements=selected,
+                    payment_payload=payload,
+                )
+                for hook in self._after_payment_creation_hooks:
+                    yield ("after", hook, result_context)
 
             return payload
 
@@ -365,19 +366,19 @@ class x402ClientBase:
         # 1. Select requirements
         selected = self._select_requirements_v1(payment_required.accepts)
 
-        # 2. Build context
-        context = PaymentCreationContext(
-            payment_required=payment_required,
-            selected_requirements=selected,
-        )
-
-        # 3. Execute before hooks
-        for hook in self._before_payment_creation_hooks:
-            result = yield ("before", hook, context)
-            if isinstance(result, AbortResult):
-                from .schemas import PaymentAbortedError
+        # 2-3. Build context and execute before hooks (skipped when none are
+        # registered, which is the common case on the per-request path)
+        if self._before_payment_creation_hooks:
+            context = PaymentCreationContext(
+                payment_required=payment_required,
+                selected_requirements=selected,
+            )
+            for hook in self._before_payment_creation_hooks:
+                result = yield ("before", hook, context)
+                if isinstance(result, AbortResult):
+                    from .schemas import PaymentAbortedError
 
-                raise PaymentAbortedError(result.reason)
+                    raise PaymentAbortedError(result.reason)
 
         try:
             # 4. Find scheme client
@@ -399,13 +400,14 @@ class x402ClientBase:
             )
 
             # 7. Execute after hooks
-            result_context = PaymentCreatedContext(
-                payment_required=payment_required,
-                selected_requirements=selected,
-                payment_payload=payload,
-            )
-            for hook in self._after_payment_creation_hooks:
-                yield ("after", hook, result_context)
+            if self._after_payment_creation_hooks:
+                result_context = PaymentCreatedContext(
+                    payment_required=payment_required,
+                    selected_requirements=selected,
+                    payment_payload=payload,
+                )
+                for hook in self._after_payment_creation_hooks:
+                    yield ("after", hook, result_context)
 
             return payload
 
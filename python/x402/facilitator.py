@@ -7,6 +7,7 @@ implementations. Runs as a service, manages scheme mechanisms, handles V1/V2 rou
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Generator
 from typing import Any
 
 from typing_extensions import Self
@@ -16,6 +17,7 @@ from .facilitator_base import (
     AfterVerifyHook,
     BeforeSettleHook,
     BeforeVerifyHook,
+    HookCommand,
     OnSettleFailureHook,
     OnVerifyFailureHook,
     SyncAfterSettleHook,
@@ -78,6 +80,8 @@ class x402Facilitator(x402FacilitatorBase):
         self._after_settle_hooks: list[AfterSettleHook] = []
         self._on_settle_failure_hooks: list[OnSettleFailureHook] = []
 
+        self._settle_lock = asyncio.Lock()
+
     # ========================================================================
     # Hook Registration
     # ========================================================================
@@ -141,13 +145,7 @@ class x402Facilitator(x402FacilitatorBase):
             PaymentAbortedError: If a before hook aborts.
         """
         gen = self._verify_core(payload, requirements, payload_bytes, requirements_bytes)
-        result = None
-        try:
-            while True:
-                _, hook, ctx = gen.send(result)
-                result = await self._execute_hook(hook, ctx)
-        except StopIteration as e:
-            return e.value
+        return await self._drive(gen)
 
     # ========================================================================
     # Settle (Async)
@@ -178,14 +176,68 @@ class x402Facilitator(x402FacilitatorBase):
             PaymentAbortedError: If a before hook aborts.
         """
         gen = self._settle_core(payload, requirements, payload_bytes, requirements_bytes)
-        result = None
+        # Settlements submit transactions from the facilitator's own accounts,
+        # so scheme calls run one at a time (as they did on the event loop) to
+        # avoid nonce races; hooks and verification may overlap.
+        return await self._drive(gen, self._settle_lock)
+
+    async def _drive(
+        self,
+        gen: Generator[HookCommand, Any, Any],
+        call_lock: asyncio.Lock | None = None,
+    ) -> Any:
+        """Drive a core generator, running the scheme call in a worker thread.
+
+        Scheme facilitators are synchronous and block on RPC round-trips and
+        confirmation polling; running them via asyncio.to_thread keeps the
+        event loop free for other requests. Errors from the scheme call are
+        thrown back into the generator so failure hooks still run.
+
+        If call_lock is given, it is held around the scheme call only, not
+        around hooks. A worker thread cannot be interrupted, so if the caller
+        is cancelled mid-call we wait for the thread to finish before
+        propagating the cancellation; otherwise the lock would be released
+        while a settlement is still submitting transactions.
+        """
+        result: Any = None
+        error: Exception | None = None
         try:
             while True:
-                _, hook, ctx = gen.send(result)
-                result = await self._execute_hook(hook, ctx)
+                if error is None:
+                    phase, hook, ctx = gen.send(result)
+                else:
+                    phase, hook, ctx = gen.throw(error)
+                    error = None
+                if phase == "call":
+                    try:
+                        if call_lock is None:
+                            result = await self._run_in_thread(hook)
+                        else:
+                            async with call_lock:
+                                result = await self._run_in_thread(hook)
+                    except Exception as e:
+                        error = e
+                else:
+                    result = await self._execute_hook(hook, ctx)
         except StopIteration as e:
             return e.value
 
+    @staticmethod
+    async def _run_in_thread(call: Any) -> Any:
+        """Run call in a worker thread, outliving cancellation of the caller."""
+        task = asyncio.ensure_future(asyncio.to_thread(call))
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            while not task.done():
+                try:
+                    await asyncio.wait({task})
+                except asyncio.CancelledError:
+                    pass
+            if not task.cancelled():
+                task.exception()  # Mark retrieved; the cancellation wins
+            raise
+
     async def _execute_hook(self, hook: Any, context: Any) -> Any:
         """Execute hook, auto-detecting sync/async."""
         result = hook(context)
@@ -295,13 +347,7 @@ class x402FacilitatorSync(x402FacilitatorBase):
             PaymentAbortedError: If a before hook aborts.
         """
         gen = self._verify_core(payload, requirements, payload_bytes, requirements_bytes)
-        result = None
-        try:
-            while True:
-                _, hook, ctx = gen.send(result)
-                result = self._execute_hook_sync(hook, ctx)
-        except StopIteration as e:
-            return e.value
+        return self._drive_sync(gen)
 
     # ========================================================================
     # Settle (Sync)
@@ -332,11 +378,26 @@ class x402FacilitatorSync(x402FacilitatorBase):
             PaymentAbortedError: If a before hook aborts.
         """
         gen = self._settle_core(payload, requirements, payload_bytes, requirements_bytes)
-        result = None
+        return self._drive_sync(gen)
+
+    def _drive_sync(self, gen: Generator[HookCommand, Any, Any]) -> Any:
+        """Drive a core generator, running the scheme call inline."""
+        result: Any = None
+        error: Exception | None = None
         try:
             while True:
-                _, hook, ctx = gen.send(result)
-                result = self._execute_hook_sync(hook, ctx)
+                if error is None:
+                    phase, hook, ctx = gen.send(result)
+                else:
+                    phase, hook, ctx = gen.throw(error)
+                    error = None
+                if phase == "call":
+                    try:
+                        result = hook()
+                    except Exception as e:
+                        error = e
+                else:
+                    result = self._execute_hook_sync(hook, ctx)
         except StopIteration as e:
             return e.value
 
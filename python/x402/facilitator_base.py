@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Generator
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Generic, Literal, TypeVar
 
 from .interfaces import (
@@ -36,7 +37,6 @@ from .schemas import (
     VerifyResponse,
     VerifyResultContext,
     derive_network_pattern,
-    matches_network_pattern,
 )
 
 # ============================================================================
@@ -68,8 +68,10 @@ SyncBeforeSettleHook = Callable[[SettleContext], AbortResult | None]
 SyncAfterSettleHook = Callable[[SettleResultContext], None]
 SyncOnSettleFailureHook = Callable[[SettleFailureContext], RecoveredSettleResult | None]
 
-# Hook command type for generator-based implementation
-HookPhase = Literal["before", "after", "failure"]
+# Hook command type for generator-based implementation. Besides hook phases,
+# the core generators yield ("call", fn, None) for the blocking scheme
+# verify/settle step, so the async driver can run it off the event loop.
+HookPhase = Literal["before", "after", "failure", "call"]
 HookCommand = tuple[HookPhase, Any, Any]  # (phase, hook, context)
 
 
@@ -87,6 +89,38 @@ class SchemeData(Generic[T]):
     pattern: Network  # Wildcard like "eip155:*"
 
 
+class SchemeIndex(Generic[T]):
+    """Internal (scheme, network) lookup table over registered schemes.
+
+    Gives the same answer as scanning registrations in order and taking the
+    first whose networks contain the network or whose wildcard pattern
+    matches it, with two dict lookups instead of a scan.
+    """
+
+    def __init__(self) -> None:
+        self._exact: dict[tuple[str, Network], tuple[int, T]] = {}
+        self._wildcard: dict[tuple[str, Network], tuple[int, T]] = {}
+        self._count = 0
+
+    def add(self, scheme: str, scheme_data: SchemeData[T]) -> None:
+        """Index a registration, which loses to any registered before it."""
+        entry = (self._count, scheme_data.facilitator)
+        self._count += 1
+        for network in scheme_data.networks:
+            self._exact.setdefault((scheme, network), entry)
+        if scheme_data.pattern.endswith(":*"):
+            self._wildcard.setdefault((scheme, scheme_data.pattern), entry)
+
+    def find(self, scheme: str, network: Network) -> T | None:
+        """Return the first registered implementation matching scheme/network."""
+        exact = self._exact.get((scheme, network))
+        namespace, sep, _ = network.partition(":")
+        wildcard = self._wildcard.get((scheme, f"{namespace}:*")) if sep else None
+        if exact is None or (wildcard is not None and wildcard[0] < exact[0]):
+            exact = wildcard
+        return exact[1] if exact is not None else None
+
+
 # ============================================================================
 # Base Facilitator Class (Shared Logic)
 # ============================================================================
@@ -103,6 +137,8 @@ class x402FacilitatorBase:
         """Initialize base facilitator."""
         self._schemes: list[SchemeData[SchemeNetworkFacilitator]] = []
         self._schemes_v1: list[SchemeData[SchemeNetworkFacilitatorV1]] = []
+        self._scheme_index: SchemeIndex[SchemeNetworkFacilitator] = SchemeIndex()
+        self._scheme_index_v1: SchemeIndex[SchemeNetworkFacilitatorV1] = SchemeIndex()
         self._extensions: dict[str, FacilitatorExtension] = {}
 
         # Hooks (typed in subclasses)
@@ -132,14 +168,13 @@ class x402FacilitatorBase:
         Returns:
             Self for chaining.
         """
-        pattern = derive_network_pattern(networks)
-        self._schemes.append(
-            SchemeData(
-                facilitator=facilitator,
-                networks=set(networks),
-                pattern=pattern,
-            )
+        scheme_data = SchemeData(
+            facilitator=facilitator,
+            networks=set(networks),
+            pattern=derive_network_pattern(networks),
         )
+        self._schemes.append(scheme_data)
+        self._scheme_index.add(facilitator.scheme, scheme_data)
         return self
 
     def register_v1(
@@ -156,14 +191,13 @@ class x402FacilitatorBase:
         Returns:
             Self for chaining.
         """
-        pattern = derive_network_pattern(networks)
-        self._schemes_v1.append(
-            SchemeData(
-                facilitator=facilitator,
-                networks=set(networks),
-                pattern=pattern,
-            )
+        scheme_data = SchemeData(
+            facilitator=facilitator,
+            networks=set(networks),
+            pattern=derive_network_pattern(networks),
         )
+        self._schemes_v1.append(scheme_data)
+        self._scheme_index_v1.add(facilitator.scheme, scheme_data)
         return self
 
     def register_extension(self, extension: FacilitatorExtension) -> x402FacilitatorBase:
@@ -272,19 +306,7 @@ class x402FacilitatorBase:
         network: Network,
     ) -> SchemeNetworkFacilitator | None:
         """Find V2 facilitator for scheme/network."""
-        for scheme_data in self._schemes:
-            if scheme_data.facilitator.scheme != scheme:
-                continue
-
-            # Check if network matches
-            if network in scheme_data.networks:
-                return scheme_data.facilitator
-
-            # Check wildcard pattern
-            if matches_network_pattern(network, scheme_data.pattern):
-                return scheme_data.facilitator
-
-        return None
+        return self._scheme_index.find(scheme, network)
 
     def _find_facilitator_v1(
         self,
@@ -292,19 +314,7 @@ class x402FacilitatorBase:
         network: Network,
     ) -> SchemeNetworkFacilitatorV1 | None:
         """Find V1 facilitator for scheme/network."""
-        for scheme_data in self._schemes_v1:
-            if scheme_data.facilitator.scheme != scheme:
-                continue
-
-            # Check if network matches
-            if network in scheme_data.networks:
-                return scheme_data.facilitator
-
-            # Check wildcard pattern
-            if matches_network_pattern(network, scheme_data.pattern):
-                return scheme_data.facilitator
-
-        return None
+        return self._scheme_index_v1.find(scheme, network)
 
     def _build_facilitator_context(self) -> FacilitatorContext:
         """Build a FacilitatorContext from the registered extensions."""
@@ -383,8 +393,9 @@ class x402FacilitatorBase:
     ) -> Generator[HookCommand, Any, VerifyResponse]:
         """Core verify logic as generator.
 
-        Yields (phase, hook, context) tuples for hook execution.
-        The caller drives the generator and handles sync/async execution.
+        Yields (phase, hook, context) tuples for hook execution, and a
+        ("call", fn, None) command for the scheme call itself. The caller
+        drives the generator and handles sync/async execution.
 
         Args:
             payload: Payment payload to verify.
@@ -414,17 +425,20 @@ class x402FacilitatorBase:
                 raise PaymentAbortedError(result.reason)
 
         try:
-            # Route by version
+            # Route by version; the scheme call is run by the driver
             if payload.x402_version == 1:
-                verify_result = self._verify_v1(
+                call = partial(
+                    self._verify_v1,
                     payload,  # type: ignore[arg-type]
                     requirements,  # type: ignore[arg-type]
                 )
             else:
-                verify_result = self._verify_v2(
+                call = partial(
+                    self._verify_v2,
                     payload,  # type: ignore[arg-type]
                     requirements,  # type: ignore[arg-type]
                 )
+            verify_result = yield ("call", call, None)
 
             # Check if verification failed
             if not verify_result.is_valid:
@@ -490,8 +504,9 @@ class x402FacilitatorBase:
     ) -> Generator[HookCommand, Any, SettleResponse]:
         """Core settle logic as generator.
 
-        Yields (phase, hook, context) tuples for hook execution.
-        The caller drives the generator and handles sync/async execution.
+        Yields (phase, hook, context) tuples for hook execution, and a
+        ("call", fn, None) command for the scheme call itself. The caller
+        drives the generator and handles sync/async execution.
 
         Args:
             payload: Payment payload to settle.
@@ -521,17 +536,20 @@ class x402FacilitatorBase:
                 raise PaymentAbortedError(result.reason)
 
         try:
-            # Route by version
+            # Route by version; the scheme call is run by the driver
             if payload.x402_version == 1:
-                settle_result = self._settle_v1(
+                call = partial(
+                    self._settle_v1,
                     payload,  # type: ignore[arg-type]
                     requirements,  # type: ignore[arg-type]
                 )
             else:
-                settle_result = self._settle_v2(
+                call = partial(
+                    self._settle_v2,
                     payload,  # type: ignore[arg-type]
                     requirements,  # type: ignore[arg-type]
                 )
+            settle_result = yield ("call", call, None)
 
             # Check if settlement failed
             if not settle_result.success:
@@ -181,6 +181,21 @@ def x402_httpx_transport(
     return x402AsyncTransport(client, transport)
 
 
+# AsyncClient options that only take effect on the transport it builds itself.
+# When a custom transport is supplied, httpx ignores them, so they are forwarded
+# to the inner AsyncHTTPTransport to keep connection pooling configurable.
+_TRANSPORT_KWARGS = ("verify", "cert", "trust_env", "http1", "http2", "limits")
+
+
+def _payment_transport(
+    client: x402Client | x402HTTPClient,
+    httpx_kwargs: dict[str, Any],
+) -> x402AsyncTransport:
+    """Create a payment transport honoring transport-level AsyncClient options."""
+    transport_kwargs = {k: httpx_kwargs[k] for k in _TRANSPORT_KWARGS if k in httpx_kwargs}
+    return x402AsyncTransport(client, httpx.AsyncHTTPTransport(**transport_kwargs))
+
+
 # Legacy alias for backwards compatibility (event hooks don't work correctly)
 def x402_httpx_hooks(
     client: x402Client | x402HTTPClient,
@@ -241,7 +256,7 @@ def wrapHttpxWithPayment(
             response = await client.get("https://api.example.com/paid")
         ```
     """
-    transport = x402AsyncTransport(x402_client)
+    transport = _payment_transport(x402_client, httpx_kwargs)
     return httpx.AsyncClient(transport=transport, **httpx_kwargs)
 
 
@@ -320,8 +335,10 @@ class x402HttpxClient(httpx.AsyncClient):
 
         Args:
             x402_client: x402Client or x402HTTPClient for payments.
-            **kwargs: Additional arguments for httpx.AsyncClient.
+            **kwargs: Additional arguments for httpx.AsyncClient. Connection
+                options such as ``limits`` and ``http2`` are applied to the
+                pooled transport used for both the initial and paid requests.
         """
         # Create payment transport
-        transport = x402AsyncTransport(x402_client)
+        transport = _payment_transport(x402_client, kwargs)
         super().__init__(transport=transport, **kwargs)
@@ -13,7 +13,7 @@ try:
     from fastapi import Request, Response
     from fastapi.responses import HTMLResponse, JSONResponse
     from starlette.middleware.base import BaseHTTPMiddleware
-    from starlette.types import ASGIApp
+    from starlette.types import ASGIApp, Receive, Scope, Send
 except ImportError as e:
     raise ImportError(
         "FastAPI middleware requires fastapi and starlette. Install with: uv add x402[fastapi]"
@@ -248,6 +248,16 @@ def payment_middleware(
             return await fastapi_payment_middleware(routes, server)(request, call_next)
         ```
     """
+    http_server = _create_http_server(routes, server, paywall_provider)
+    return _build_payment_middleware(http_server, paywall_config, sync_facilitator_on_start)
+
+
+def _create_http_server(
+    routes: RoutesConfig,
+    server: x402ResourceServer,
+    paywall_provider: PaywallProvider | None,
+) -> x402HTTPResourceServer:
+    """Wrap a resource server for HTTP, registering extensions and paywall."""
     # Auto-register bazaar extension if routes declare it
     if _check_if_bazaar_needed(routes):
         _register_bazaar_extension(server)
@@ -258,6 +268,15 @@ def payment_middleware(
     if paywall_provider:
         http_server.register_paywall_provider(paywall_provider)
 
+    return http_server
+
+
+def _build_payment_middleware(
+    http_server: x402HTTPResourceServer,
+    paywall_config: PaywallConfig | None,
+    sync_facilitator_on_start: bool,
+) -> Callable[[Request, Callable[[Request], Awaitable[Response]]], Awaitable[Response]]:
+    """Build the request/call_next middleware function around an HTTP server."""
     # Lazy initialization state with async lock for concurrency safety
     init_done = False
     init_lock = asyncio.Lock()
@@ -439,7 +458,9 @@ class PaymentMiddlewareASGI(BaseHTTPMiddleware):
     """ASGI middleware class for payment handling.
 
     Alternative to the function-based middleware for use with
-    app.add_middleware().
+    app.add_middleware(). Requests to routes that need no payment (and
+    non-HTTP scopes) are passed straight to the wrapped app, skipping the
+    BaseHTTPMiddleware request/response wrapping.
 
     Example:
         ```python
@@ -469,7 +490,27 @@ class PaymentMiddlewareASGI(BaseHTTPMiddleware):
             paywall_provider: Optional custom paywall provider.
         """
         super().__init__(app)
-        self._middleware = payment_middleware(routes, server, paywall_config, paywall_provider)
+        self._http_server = _create_http_server(routes, server, paywall_provider)
+        self._middleware = _build_payment_middleware(
+            self._http_server, paywall_config, sync_facilitator_on_start=True
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Route only payment-protected HTTP requests through dispatch()."""
+        # Methods no route names (HEAD/OPTIONS probes, etc.) are rejected from
+        # the scope alone, before a Request or adapter is built
+        if scope["type"] == "http" and self._http_server.has_routes_for_method(scope["method"]):
+            request = Request(scope)
+            context = HTTPRequestContext(
+                adapter=FastAPIAdapter(request),
+                path=request.url.path,
+                method=request.method,
+            )
+            if self._http_server.requires_payment(context):
+                await super().__call__(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
 
     async def dispatch(
         self,
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import base64
 import json
+from binascii import a2b_base64, b2a_base64
 from typing import Any
 
 from ..schemas import (
@@ -16,13 +16,17 @@ from .constants import PAYMENT_REQUIRED_HEADER, X_PAYMENT_HEADER
 
 
 def safe_base64_encode(data: str) -> str:
-    """Base64 encode a string safely."""
-    return base64.b64encode(data.encode("utf-8")).decode("utf-8")
+    """Base64 encode a string safely.
+
+    Calls binascii directly rather than the base64 wrappers, since header
+    values are encoded and decoded on every paid request.
+    """
+    return b2a_base64(data.encode("utf-8"), newline=False).decode("ascii")
 
 
 def safe_base64_decode(data: str) -> str:
     """Base64 decode a string safely."""
-    return base64.b64decode(data.encode("utf-8")).decode("utf-8")
+    return a2b_base64(data.encode("utf-8")).decode("utf-8")
 
 
 def encode_payment_signature_header(payload: PaymentPayload | PaymentPayloadV1) -> str:
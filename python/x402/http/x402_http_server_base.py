@@ -150,6 +150,34 @@ class x402HTTPServerBase:
                 CompiledRoute(verb=verb, regex=regex, config=config, pattern=path)
             )
 
+        self._route_index = self._build_route_index(self._compiled_routes)
+
+    @staticmethod
+    def _build_route_index(
+        compiled_routes: list[CompiledRoute],
+    ) -> dict[str, tuple[list[tuple[int, CompiledRoute]], dict[str, tuple[int, CompiledRoute]]]]:
+        """Group compiled routes by verb for matching.
+
+        Each verb (plus "*" for verbs no route names) maps to the routes that
+        can match it, split into pattern routes, kept in declaration order,
+        and literal routes keyed by lower-cased path. Positions are kept so
+        the first declared match still wins.
+        """
+        verbs = {route.verb for route in compiled_routes} | {"*"}
+        index = {}
+        for verb in verbs:
+            dynamic: list[tuple[int, CompiledRoute]] = []
+            literal: dict[str, tuple[int, CompiledRoute]] = {}
+            for position, route in enumerate(compiled_routes):
+                if route.verb not in ("*", verb):
+                    continue
+                if route.regex.pattern == f"^{re.escape(route.pattern)}$":
+                    literal.setdefault(route.pattern.lower(), (position, route))
+                else:
+                    dynamic.append((position, route))
+            index[verb] = (dynamic, literal)
+        return index
+
     def _parse_route_config(self, config: dict[str, Any]) -> RouteConfig:
         """Parse a raw dict into a RouteConfig."""
         accepts = config.get("accepts", [])
@@ -246,16 +274,36 @@ class x402HTTPServerBase:
         # correct check for a union-with-None return type and does not rely on tuple truthiness.
         return self._get_route_config(context.path, method) is not None
 
+    def has_routes_for_method(self, method: str) -> bool:
+        """Check if any configured route can match an HTTP method.
+
+        A cheap pre-check for middleware: when this is False no request with
+        this method can require payment, whatever its path.
+
+        Args:
+            method: HTTP method (e.g. "GET").
+
+        Returns:
+            True if at least one route accepts the method.
+        """
+        dynamic, literal = self._route_index.get(method.upper(), self._route_index["*"])
+        return bool(dynamic or literal)
+
     def _get_route_config(self, path: str, method: str) -> tuple[RouteConfig, str] | None:
         """Find matching route configuration, returning (config, pattern) or None."""
         normalized_path = self._normalize_path(path)
-        upper_method = method.upper()
+        dynamic, literal = self._route_index.get(method.upper(), self._route_index["*"])
 
-        for route in self._compiled_routes:
+        # A literal hit only wins if no pattern route declared before it matches
+        hit = literal.get(normalized_path.lower())
+        for position, route in dynamic:
+            if hit is not None and position > hit[0]:
+                break
             if route.regex.match(normalized_path):
-                if route.verb == "*" or route.verb == upper_method:
-                    return route.config, route.pattern
+                return route.config, route.pattern
 
+        if hit is not None:
+            return hit[1].config, hit[1].pattern
         return None
 
     # =========================================================================
@@ -1,5 +1,7 @@
 """EVM mechanism for x402 payment protocol."""
 
+from typing import TYPE_CHECKING
+
 # Constants
 from .constants import (
     AUTHORIZATION_STATE_ABI,
@@ -55,9 +57,6 @@ from .erc6492 import (
 # Signer protocols
 from .signer import ClientEvmSigner, FacilitatorEvmSigner
 
-# Signer implementations
-from .signers import EthAccountSigner, EthAccountSignerWithRPC, FacilitatorWeb3Signer
-
 # Types
 from .types import (
     AUTHORIZATION_TYPES,
@@ -185,3 +184,23 @@ __all__ = [
     "verify_eip1271_signature",
     "verify_universal_signature",
 ]
+
+
+if TYPE_CHECKING:
+    from .signers import EthAccountSigner, EthAccountSignerWithRPC, FacilitatorWeb3Signer
+
+
+def __getattr__(name: str):
+    """Lazy import of signer implementations.
+
+    The signers pull in eth_account and web3, which servers that only build
+    requirements never need.
+    """
+    if name in ("EthAccountSigner", "EthAccountSignerWithRPC", "FacilitatorWeb3Signer"):
+        from . import signers as _signers
+
+        value = getattr(_signers, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
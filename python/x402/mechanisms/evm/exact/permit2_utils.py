@@ -45,6 +45,7 @@ from ..constants import (  # noqa: E402
     X402_EXACT_PERMIT2_PROXY_ADDRESS,
     X402_EXACT_PERMIT2_PROXY_SETTLE_WITH_PERMIT_ABI,
 )
+from ..multicall import MulticallCall, multicall  # noqa: E402
 from ..signer import ClientEvmSigner, FacilitatorEvmSigner  # noqa: E402
 from ..types import (  # noqa: E402
     ExactPermit2Authorization,
@@ -290,9 +291,12 @@ def verify_permit2(
             is_valid=False, invalid_reason=ERR_PERMIT2_INVALID_SIGNATURE, payer=payer
         )
 
+    # Allowance and balance are fetched together in one RPC round trip
+    allowance, balance = _read_permit2_allowance_and_balance(signer, token_address, payer)
+
     # 10. Allowance check — with extension fallbacks
     allowance_result = _verify_permit2_allowance(
-        signer, payload, requirements, payer, token_address, context
+        payload, requirements, payer, token_address, allowance, context
     )
     if allowance_result is not None:
         logger.warning(
@@ -302,25 +306,77 @@ def verify_permit2(
     logger.info("Permit2 verify: allowance OK")
 
     # 11. Balance check (fail closed — RPC failure rejects rather than allowing underfunded payments)
-    try:
-        balance = signer.read_contract(token_address, BALANCE_OF_ABI, "balanceOf", payer)
-        if int(balance) < int(requirements.amount):
-            return VerifyResponse(
-                is_valid=False, invalid_reason=ERR_INSUFFICIENT_BALANCE, payer=payer
-            )
-    except Exception:
-        logger.warning("Permit2 verify: balance check failed for payer=%s", payer, exc_info=True)
+    if balance is None:
+        logger.warning("Permit2 verify: balance check failed for payer=%s", payer)
         return VerifyResponse(is_valid=False, invalid_reason="balance_check_failed", payer=payer)
+    if balance < int(requirements.amount):
+        return VerifyResponse(is_valid=False, invalid_reason=ERR_INSUFFICIENT_BALANCE, payer=payer)
 
     return VerifyResponse(is_valid=True, payer=payer)
 
 
-def _verify_permit2_allowance(
+def _read_permit2_allowance_and_balance(
     signer: FacilitatorEvmSigner,
+    token_address: str,
+    payer: str,
+) -> tuple[int | None, int | None]:
+    """Read the payer's Permit2 allowance and token balance.
+
+    Both reads are batched into a single Multicall3 call. If the batch itself
+    fails (e.g. no Multicall3 on the chain), each value is read individually.
+
+    Returns:
+        (allowance, balance), each None if its read failed.
+    """
+    try:
+        allowance_result, balance_result = multicall(
+            signer,
+            [
+                MulticallCall(
+                    address=token_address,
+                    abi=ERC20_ALLOWANCE_ABI,
+                    function_name="allowance",
+                    args=(payer, PERMIT2_ADDRESS),
+                ),
+                MulticallCall(
+                    address=token_address,
+                    abi=BALANCE_OF_ABI,
+                    function_name="balanceOf",
+                    args=(payer,),
+                ),
+            ],
+        )
+    except Exception:
+        logger.debug("Permit2 verify: multicall failed, reading individually", exc_info=True)
+    else:
+        return (
+            int(allowance_result.result) if allowance_result.success else None,
+            int(balance_result.result) if balance_result.success else None,
+        )
+
+    allowance: int | None = None
+    balance: int | None = None
+    try:
+        allowance = int(
+            signer.read_contract(
+                token_address, ERC20_ALLOWANCE_ABI, "allowance", payer, PERMIT2_ADDRESS
+            )
+        )
+    except Exception:
+        logger.debug("Permit2 verify: allowance read failed", exc_info=True)
+    try:
+        balance = int(signer.read_contract(token_address, BALANCE_OF_ABI, "balanceOf", payer))
+    except Exception:
+        logger.debug("Permit2 verify: balance read failed", exc_info=True)
+    return allowance, balance
+
+
+def _verify_permit2_allowance(
     payload: PaymentPayload,
     requirements: PaymentRequirements,
     payer: str,
     token_address: str,
+    allowance: int | None,
     context: FacilitatorContext | None,
 ) -> VerifyResponse | None:
     """Check Permit2 allowance with extension fallbacks.
@@ -345,21 +401,9 @@ def _verify_permit2_allowance(
         validate_erc20_approval_for_payment,
     )
 
-    needs_extension = True
-    try:
-        allowance = signer.read_contract(
-            token_address,
-            ERC20_ALLOWANCE_ABI,
-            "allowance",
-            payer,
-            PERMIT2_ADDRESS,
-        )
-        if int(allowance) >= int(requirements.amount):
-            needs_extension = False
-    except Exception:
-        logger.warning("Permit2 verify: allowance check failed for payer=%s", payer, exc_info=True)
-
-    if not needs_extension:
+    if allowance is None:
+        logger.warning("Permit2 verify: allowance check failed for payer=%s", payer)
+    elif allowance >= int(requirements.amount):
         return None
 
     # Try EIP-2612 gas sponsoring extension first
@@ -4,6 +4,7 @@ import os
 import re
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 
 try:
     from eth_utils import to_checksum_address
@@ -133,10 +134,12 @@ def create_permit2_nonce() -> str:
     return str(int.from_bytes(os.urandom(32), "big"))
 
 
+@lru_cache(maxsize=1024)
 def normalize_address(address: str) -> str:
     """Normalize Ethereum address to checksummed format.
 
-    Uses EIP-55 checksum algorithm.
+    Uses EIP-55 checksum algorithm. Results are memoized, since verify and
+    settle re-normalize the same asset and payTo addresses on every payment.
 
     Args:
         address: Ethereum address (with or without 0x prefix).
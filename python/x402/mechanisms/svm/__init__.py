@@ -1,5 +1,7 @@
 """SVM mechanism for x402 payment protocol."""
 
+from typing import TYPE_CHECKING
+
 # Constants
 from .constants import (
     COMPUTE_BUDGET_PROGRAM_ADDRESS,
@@ -58,9 +60,6 @@ from .settlement_cache import SettlementCache
 # Signer protocols
 from .signer import ClientSvmSigner, FacilitatorSvmSigner
 
-# Signer implementations
-from .signers import FacilitatorKeypairSigner, KeypairSigner
-
 # Types
 from .types import (
     ExactSvmPayload,
@@ -165,3 +164,23 @@ __all__ = [
     "extract_transaction_info",
     "derive_ata",
 ]
+
+
+if TYPE_CHECKING:
+    from .signers import FacilitatorKeypairSigner, KeypairSigner
+
+
+def __getattr__(name: str):
+    """Lazy import of signer implementations.
+
+    The keypair signers pull in the Solana RPC client (and httpx), which
+    servers that only build requirements never need.
+    """
+    if name in ("KeypairSigner", "FacilitatorKeypairSigner"):
+        from . import signers as _signers
+
+        value = getattr(_signers, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
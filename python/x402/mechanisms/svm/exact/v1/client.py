@@ -3,10 +3,9 @@
 import base64
 import binascii
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 try:
-    from solana.rpc.api import Client as SolanaClient
     from solders.instruction import AccountMeta, Instruction
     from solders.message import MessageV0
     from solders.pubkey import Pubkey
@@ -17,6 +16,9 @@ except ImportError as e:
         "SVM mechanism requires solana packages. Install with: pip install x402[svm]"
     ) from e
 
+if TYPE_CHECKING:
+    from solana.rpc.api import Client as SolanaClient
+
 from .....schemas.v1 import PaymentRequirementsV1
 from ...constants import (
     COMPUTE_BUDGET_PROGRAM_ADDRESS,
@@ -60,7 +62,7 @@ class ExactSvmSchemeV1:
         self._custom_rpc_url = rpc_url
         self._clients: dict[str, SolanaClient] = {}
 
-    def _get_client(self, network: str) -> SolanaClient:
+    def _get_client(self, network: str) -> "SolanaClient":
         """Get or create RPC client for network.
 
         Args:
@@ -82,6 +84,10 @@ class ExactSvmSchemeV1:
                 raise ValueError(f"Unsupported network: {network}")
             rpc_url = config["rpc_url"]
 
+        # Imported on first use: solana.rpc loads httpx, which payers that
+        # never fetch a blockhash do not need
+        from solana.rpc.api import Client as SolanaClient
+
         client = SolanaClient(rpc_url)
         self._clients[caip2_network] = client
         return client
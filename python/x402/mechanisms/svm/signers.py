@@ -8,6 +8,7 @@ try:
     from solana.rpc.commitment import Confirmed
     from solana.rpc.types import TxOpts
     from solders.keypair import Keypair
+    from solders.message import to_bytes_versioned
     from solders.signature import Signature
     from solders.transaction import VersionedTransaction
 except ImportError as e:
@@ -38,6 +39,8 @@ class KeypairSigner:
             keypair: Solders Keypair instance.
         """
         self._keypair = keypair
+        # Base58-encode the public key once; it is read on every payment
+        self._address = str(keypair.pubkey())
 
     @property
     def address(self) -> str:
@@ -46,7 +49,7 @@ class KeypairSigner:
         Returns:
             Base58 encoded public key.
         """
-        return str(self._keypair.pubkey())
+        return self._address
 
     @property
     def keypair(self) -> Keypair:
@@ -195,73 +198,19 @@ class FacilitatorKeypairSigner:
         tx_bytes = base64.b64decode(tx_base64)
         tx = VersionedTransaction.from_bytes(tx_bytes)
 
-        # Determine if this is a versioned (v0) or legacy transaction
-        # Versioned transactions have a version byte prefix >= 128 (0x80)
-        # Legacy transactions have their first byte (numRequiredSignatures) < 128
-        is_versioned = self._is_versioned_transaction(tx_bytes)
-
-        message = tx.message
-        if is_versioned:
-            # Versioned transaction (MessageV0): prepend 0x80 version byte before signing
-            msg_bytes_with_version = bytes([0x80]) + bytes(message)
-            facilitator_signature = keypair.sign_message(msg_bytes_with_version)
-        else:
-            # Legacy transaction: sign message bytes directly (no version prefix)
-            facilitator_signature = keypair.sign_message(bytes(message))
+        # to_bytes_versioned serializes the parsed message with its 0x80 prefix
+        # for v0 and without one for legacy. Signing the parsed message, not a
+        # slice of the input, ignores any trailing bytes after the transaction.
+        facilitator_signature = keypair.sign_message(to_bytes_versioned(tx.message))
 
         # Fee payer is always at index 0, client signature at index 1
         signatures = list(tx.signatures)
         signatures[0] = facilitator_signature
-        signed_tx = VersionedTransaction.populate(message, signatures)
+        signed_tx = VersionedTransaction.populate(tx.message, signatures)
 
         # Re-encode
         return base64.b64encode(bytes(signed_tx)).decode("utf-8")
 
-    def _is_versioned_transaction(self, tx_bytes: bytes) -> bool:
-        """Determine if transaction bytes represent a versioned or legacy transaction.
-
-        Versioned transactions (v0) have a version byte prefix where the first byte
-        of the message portion is >= 128 (0x80). Legacy transactions have their
-        first message byte (numRequiredSignatures header) < 128.
-
-        Args:
-            tx_bytes: Raw transaction bytes.
-
-        Returns:
-            True if versioned (v0), False if legacy.
-        """
-        # Transaction structure:
-        # - CompactU16 length prefix for signatures count
-        # - Signatures (64 bytes each)
-        # - Message bytes
-        #
-        # To find where the message starts, we need to skip the signatures.
-        # CompactU16: if first byte < 128, it's the value; otherwise it's multi-byte
-
-        offset = 0
-
-        # Read compact u16 for signature count
-        first_byte = tx_bytes[offset]
-        if first_byte < 0x80:
-            # Single byte encoding
-            num_signatures = first_byte
-            offset += 1
-        else:
-            # Multi-byte encoding (shouldn't happen for reasonable signature counts)
-            num_signatures = (first_byte & 0x7F) | ((tx_bytes[offset + 1] & 0x7F) << 7)
-            offset += 2
-
-        # Skip signatures (64 bytes each)
-        offset += num_signatures * 64
-
-        # First byte of message determines version
-        # >= 128 (0x80) means versioned (v0), < 128 means legacy
-        if offset < len(tx_bytes):
-            message_first_byte = tx_bytes[offset]
-            return message_first_byte >= 0x80
-
-        return False
-
     def simulate_transaction(self, tx_base64: str, network: str) -> None:
         """Simulate a transaction.
 
@@ -3,6 +3,7 @@
 import base64
 import re
 from decimal import Decimal
+from functools import lru_cache
 
 try:
     from solders.pubkey import Pubkey
@@ -320,9 +321,13 @@ def extract_transaction_info(tx: VersionedTransaction) -> TransactionInfo | None
     return None
 
 
+@lru_cache(maxsize=1024)
 def derive_ata(owner: str, mint: str, token_program: str | None = None) -> str:
     """Derive the Associated Token Account (ATA) address.
 
+    Results are memoized: the PDA search is deterministic, and clients and
+    facilitators derive the same payTo/mint accounts on every payment.
+
     Args:
         owner: Owner wallet address.
         mint: Token mint address.
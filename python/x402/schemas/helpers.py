@@ -263,12 +263,13 @@ def find_schemes_by_network(
         Dict of scheme -> implementation, or None if not found.
     """
     # Try exact match first
-    if network in schemes:
-        return schemes[network]
-
-    # Try wildcard patterns
-    for pattern, scheme_map in schemes.items():
-        if matches_network_pattern(network, pattern):
-            return scheme_map
-
-    return None
+    scheme_map = schemes.get(network)
+    if scheme_map is not None:
+        return scheme_map
+
+    # Wildcard patterns are keyed as "<namespace>:*", so a single lookup on the
+    # CAIP-2 namespace replaces scanning every registered pattern
+    namespace, sep, _ = network.partition(":")
+    if not sep:
+        return None
+    return schemes.get(f"{namespace}:*")
@@ -727,3 +727,61 @@ class TestColonParamRouteMatching:
 
         result = components.process_http_request(context)
         assert result.type == "no-payment-required"
+
+
+class TestRouteMatchingOrder:
+    """Tests that route lookup honours verbs, case and declaration order."""
+
+    @staticmethod
+    def _option(price: str) -> dict[str, Any]:
+        return {
+            "accepts": {
+                "scheme": "cash",
+                "payTo": "merchant@example.com",
+                "price": price,
+                "network": "x402:cash",
+            },
+        }
+
+    def _match(self, routes: dict, path: str, method: str = "GET") -> str | None:
+        http_server = _create_sync_http_components(routes).http_server
+        match = http_server._get_route_config(path, method)
+        return match[1] if match else None
+
+    def test_earlier_wildcard_wins_over_later_literal(self) -> None:
+        """A pattern declared before a literal route still takes precedence."""
+        routes = {
+            "GET /api/*": self._option("$0.10"),
+            "GET /api/weather": self._option("$0.20"),
+        }
+        assert self._match(routes, "/api/weather") == "/api/*"
+
+    def test_earlier_literal_wins_over_later_wildcard(self) -> None:
+        """A literal route declared first wins over a later pattern."""
+        routes = {
+            "GET /api/weather": self._option("$0.20"),
+            "GET /api/*": self._option("$0.10"),
+        }
+        assert self._match(routes, "/api/weather") == "/api/weather"
+
+    def test_literal_match_is_case_insensitive_and_verb_specific(self) -> None:
+        """Literal routes match case-insensitively, only for their verb."""
+        routes = {
+            "POST /api/Weather": self._option("$0.20"),
+            "/api/any": self._option("$0.10"),
+        }
+        assert self._match(routes, "/API/weather/", "post") == "/api/Weather"
+        assert self._match(routes, "/api/weather", "GET") is None
+        assert self._match(routes, "/api/any", "DELETE") == "/api/any"
+
+    def test_has_routes_for_method(self) -> None:
+        """Only verbs named by a route, or any verb for verb-less routes, match."""
+        http_server = _create_sync_http_components(
+            {"GET /api/*": self._option("$0.10")}
+        ).http_server
+        assert http_server.has_routes_for_method("get")
+        assert not http_server.has_routes_for_method("HEAD")
+        assert not http_server.has_routes_for_method("POST")
+
+        http_server = _create_sync_http_components({"/api/any": self._option("$0.10")}).http_server
+        assert http_server.has_routes_for_method("OPTIONS")
@@ -1,6 +1,7 @@
 """Unit tests for x402Client and x402ClientSync - manual registration and policies."""
 
 from x402 import (
+    find_schemes_by_network,
     prefer_network,
     x402Client,
     x402ClientSync,
@@ -94,6 +95,26 @@ class TestX402ClientRegistration:
         assert len(registered[2]) == 2
 
 
+class TestSchemeLookup:
+    """Tests for exact and wildcard network lookup of registered schemes."""
+
+    def test_exact_registration_takes_precedence(self):
+        """Test that an exact network registration wins over the wildcard."""
+        wildcard = MockSchemeClient("exact")
+        specific = MockSchemeClient("exact")
+        schemes = {"eip155:*": {"exact": wildcard}, "eip155:1": {"exact": specific}}
+
+        assert find_schemes_by_network(schemes, "eip155:1") == {"exact": specific}
+        assert find_schemes_by_network(schemes, "eip155:8453") == {"exact": wildcard}
+
+    def test_wildcard_does_not_match_other_namespace(self):
+        """Test that a namespace wildcard does not leak into other namespaces."""
+        schemes = {"eip155:*": {"exact": MockSchemeClient("exact")}}
+
+        assert find_schemes_by_network(schemes, "solana:mainnet") is None
+        assert find_schemes_by_network(schemes, "eip155") is None
+
+
 class TestX402ClientSyncRegistration:
     """Tests for x402ClientSync scheme registration."""
 
@@ -297,3 +318,27 @@ class TestGetRegisteredSchemes:
         assert len(registered[1]) == 1
         assert registered[2][0]["network"] == "eip155:8453"
         assert registered[1][0]["network"] == "base-sepolia"
+
+    def test_reflects_registration_after_first_call(self):
+        """Test that registering after a lookup is visible on the next call."""
+        client = x402Client()
+        client.register("eip155:8453", MockSchemeClient())
+        assert len(client.get_registered_schemes()[2]) == 1
+
+        client.register("eip155:1", MockSchemeClient())
+        client.register_v1("base-sepolia", MockSchemeClientV1())
+
+        registered = client.get_registered_schemes()
+        assert len(registered[2]) == 2
+        assert len(registered[1]) == 1
+
+    def test_returned_lists_are_independent(self):
+        """Test that mutating a returned result does not affect later calls."""
+        client = x402Client()
+        client.register("eip155:8453", MockSchemeClient())
+
+        registered = client.get_registered_schemes()
+        registered[2][0]["network"] = "eip155:1"
+        registered[2].clear()
+
+        assert client.get_registered_schemes()[2] == [{"network": "eip155:8453", "scheme": "mock"}]
@@ -1,8 +1,19 @@
 """Unit tests for x402Facilitator and x402FacilitatorSync."""
 
+import asyncio
+import threading
+
+import pytest
+
 from x402 import x402Facilitator, x402FacilitatorSync
 from x402.interfaces import FacilitatorExtension
-from x402.schemas import SettleResponse, VerifyResponse
+from x402.schemas import (
+    PaymentPayload,
+    PaymentRequirements,
+    RecoveredSettleResult,
+    SettleResponse,
+    VerifyResponse,
+)
 
 # =============================================================================
 # Mock Scheme Facilitators
@@ -342,6 +353,170 @@ class TestX402FacilitatorSyncHooks:
         assert len(facilitator._on_settle_failure_hooks) == 1
 
 
+# =============================================================================
+# Scheme Call Execution Tests
+# =============================================================================
+
+
+def make_payload(network: str = "eip155:8453") -> PaymentPayload:
+    """Build a minimal V2 payload for the mock scheme."""
+    return PaymentPayload(
+        payload={},
+        accepted=PaymentRequirements(
+            scheme="mock",
+            network=network,
+            asset="0xasset",
+            amount="1",
+            pay_to="0xpayee",
+            max_timeout_seconds=60,
+        ),
+    )
+
+
+class ThreadRecordingFacilitator(MockSchemeNetworkFacilitator):
+    """Mock facilitator that records which thread its calls run on."""
+
+    def __init__(self, fail_settle: bool = False):
+        super().__init__()
+        self.fail_settle = fail_settle
+        self.threads: list[int] = []
+
+    def verify(self, payload, requirements, context=None) -> VerifyResponse:
+        self.threads.append(threading.get_ident())
+        return super().verify(payload, requirements, context)
+
+    def settle(self, payload, requirements, context=None) -> SettleResponse:
+        self.threads.append(threading.get_ident())
+        if self.fail_settle:
+            raise RuntimeError("rpc down")
+        return super().settle(payload, requirements, context)
+
+
+class BlockingSettleFacilitator(MockSchemeNetworkFacilitator):
+    """Mock facilitator whose settle blocks until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def settle(self, payload, requirements, context=None) -> SettleResponse:
+        self.started.set()
+        self.release.wait(5)
+        return super().settle(payload, requirements, context)
+
+
+class TestSchemeCallExecution:
+    """Tests for how facilitators run the blocking scheme call."""
+
+    @pytest.mark.asyncio
+    async def test_async_runs_scheme_off_event_loop_thread(self):
+        """Test that async verify/settle run the scheme in a worker thread."""
+        scheme = ThreadRecordingFacilitator()
+        facilitator = x402Facilitator().register(["eip155:8453"], scheme)
+        payload = make_payload()
+
+        await facilitator.verify(payload, payload.accepted)
+        await facilitator.settle(payload, payload.accepted)
+
+        assert len(scheme.threads) == 2
+        assert threading.get_ident() not in scheme.threads
+
+    @pytest.mark.asyncio
+    async def test_async_scheme_error_reaches_failure_hooks(self):
+        """Test that a scheme error in a worker thread still runs failure hooks."""
+        scheme = ThreadRecordingFacilitator(fail_settle=True)
+        errors: list[Exception] = []
+        recovered = SettleResponse(success=True, transaction="0xrecovered", network="eip155:8453")
+
+        def on_failure(ctx):
+            errors.append(ctx.error)
+            return RecoveredSettleResult(result=recovered)
+
+        facilitator = (
+            x402Facilitator().register(["eip155:8453"], scheme).on_settle_failure(on_failure)
+        )
+        payload = make_payload()
+
+        result = await facilitator.settle(payload, payload.accepted)
+
+        assert result is recovered
+        assert [str(e) for e in errors] == ["rpc down"]
+
+    @pytest.mark.asyncio
+    async def test_async_scheme_error_propagates_without_recovery(self):
+        """Test that an unrecovered scheme error is raised to the caller."""
+        scheme = ThreadRecordingFacilitator(fail_settle=True)
+        facilitator = x402Facilitator().register(["eip155:8453"], scheme)
+        payload = make_payload()
+
+        with pytest.raises(RuntimeError, match="rpc down"):
+            await facilitator.settle(payload, payload.accepted)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_settle_holds_lock_until_scheme_returns(self):
+        """Test that cancelling settle does not release the lock mid-settlement."""
+        scheme = BlockingSettleFacilitator()
+        facilitator = x402Facilitator().register(["eip155:8453"], scheme)
+        payload = make_payload()
+
+        task = asyncio.create_task(facilitator.settle(payload, payload.accepted))
+        assert await asyncio.to_thread(scheme.started.wait, 5)
+        task.cancel()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert not task.done()
+        assert facilitator._settle_lock.locked()
+
+        scheme.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert len(scheme.settle_calls) == 1
+        assert not facilitator._settle_lock.locked()
+
+    @pytest.mark.asyncio
+    async def test_slow_settle_hook_does_not_block_other_settlements(self):
+        """Test that the settle lock covers only the scheme call, not hooks."""
+        scheme = ThreadRecordingFacilitator()
+        hook_entered = asyncio.Event()
+        release_hook = asyncio.Event()
+
+        async def after_settle(ctx):
+            if not hook_entered.is_set():
+                hook_entered.set()
+                await release_hook.wait()
+
+        facilitator = (
+            x402Facilitator().register(["eip155:8453"], scheme).on_after_settle(after_settle)
+        )
+        payload = make_payload()
+
+        first = asyncio.create_task(facilitator.settle(payload, payload.accepted))
+        await asyncio.wait_for(hook_entered.wait(), 5)
+
+        second = asyncio.create_task(facilitator.settle(payload, payload.accepted))
+        await asyncio.wait_for(second, 5)
+
+        assert len(scheme.settle_calls) == 2
+        assert not first.done()
+
+        release_hook.set()
+        await first
+
+    def test_sync_runs_scheme_inline(self):
+        """Test that the sync facilitator runs the scheme on the calling thread."""
+        scheme = ThreadRecordingFacilitator()
+        facilitator = x402FacilitatorSync().register(["eip155:8453"], scheme)
+        payload = make_payload()
+
+        facilitator.verify(payload, payload.accepted)
+        facilitator.settle(payload, payload.accepted)
+
+        assert scheme.threads == [threading.get_ident()] * 2
+
+
 # =============================================================================
 # Internal Helper Tests
 # =============================================================================
@@ -389,6 +564,33 @@ class TestFindFacilitator:
         # Exact match should work
         assert facilitator._find_facilitator("exact", "eip155:8453") is mock_scheme
 
+    def test_wildcard_covers_other_networks_in_namespace(self):
+        """Test that a same-namespace registration matches any network in it."""
+        facilitator = x402Facilitator()
+        mock_scheme = MockSchemeNetworkFacilitator("exact")
+        facilitator.register(["eip155:8453", "eip155:84532"], mock_scheme)
+
+        assert facilitator._find_facilitator("exact", "eip155:1") is mock_scheme
+        assert facilitator._find_facilitator("exact", "eip155") is None
+
+    def test_earlier_registration_wins(self):
+        """Test that the first matching registration wins, exact or wildcard."""
+        facilitator = x402Facilitator()
+        wildcard = MockSchemeNetworkFacilitator("exact")
+        specific = MockSchemeNetworkFacilitator("exact")
+        facilitator.register(["eip155:8453", "eip155:84532"], wildcard)
+        facilitator.register(["eip155:1"], specific)
+
+        assert facilitator._find_facilitator("exact", "eip155:1") is wildcard
+
+        # Mixed namespaces derive no wildcard, so only eip155:1 is claimed
+        facilitator = x402Facilitator()
+        facilitator.register(["eip155:1", "solana:mainnet"], specific)
+        facilitator.register(["eip155:8453", "eip155:84532"], wildcard)
+
+        assert facilitator._find_facilitator("exact", "eip155:1") is specific
+        assert facilitator._find_facilitator("exact", "eip155:10") is wildcard
+
 
 class TestFindFacilitatorV1:
     """Tests for _find_facilitator_v1 internal method."""
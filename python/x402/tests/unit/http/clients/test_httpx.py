@@ -1,7 +1,7 @@
 """Unit tests for x402.http.clients.httpx - httpx transport wrapper."""
 
 import warnings
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -343,6 +343,26 @@ class TestX402HttpxClient:
 
         assert client.timeout.connect == 60.0
 
+    def test_forwards_transport_options_to_inner_transport(self):
+        """Test that connection options reach the transport making the requests."""
+        mock_client = MockX402Client()
+        limits = httpx.Limits(max_keepalive_connections=7, keepalive_expiry=60)
+
+        with patch("httpx.AsyncHTTPTransport") as transport_cls:
+            client = x402HttpxClient(mock_client, limits=limits, http2=True, timeout=60.0)
+
+        transport_cls.assert_called_once_with(limits=limits, http2=True)
+        assert client._transport._transport is transport_cls.return_value
+
+    def test_wrap_forwards_transport_options_to_inner_transport(self):
+        """Test that wrapHttpxWithPayment forwards connection options too."""
+        mock_client = MockX402Client()
+
+        with patch("httpx.AsyncHTTPTransport") as transport_cls:
+            wrapHttpxWithPayment(mock_client, verify=False, trust_env=False)
+
+        transport_cls.assert_called_once_with(verify=False, trust_env=False)
+
 
 # =============================================================================
 # Error Class Tests
@@ -694,3 +694,75 @@ class TestPaymentMiddlewareASGI:
 
         assert hasattr(middleware, "_middleware")
         assert callable(middleware._middleware)
+
+    def test_unprotected_route_bypasses_dispatch(self):
+        """Test that routes without payment skip dispatch() entirely."""
+        app = FastAPI()
+
+        @app.get("/api/free")
+        def free_route():
+            return {"data": "free"}
+
+        with patch("x402.http.middleware.fastapi.x402HTTPResourceServer") as mock_http_server:
+            mock_http_server.return_value.requires_payment.return_value = False
+            app.add_middleware(PaymentMiddlewareASGI, routes={}, server=MagicMock())
+
+            with (
+                patch.object(PaymentMiddlewareASGI, "dispatch") as mock_dispatch,
+                TestClient(app) as client,
+            ):
+                response = client.get("/api/free")
+
+        assert response.status_code == 200
+        assert response.json() == {"data": "free"}
+        mock_dispatch.assert_not_called()
+
+    def test_unrouted_method_skips_route_lookup(self):
+        """Test that methods no route names bypass without a route lookup."""
+        app = FastAPI()
+
+        @app.post("/api/free")
+        def free_route():
+            return {"data": "free"}
+
+        with patch("x402.http.middleware.fastapi.x402HTTPResourceServer") as mock_http_server:
+            mock_http_server_instance = mock_http_server.return_value
+            mock_http_server_instance.has_routes_for_method.return_value = False
+            app.add_middleware(PaymentMiddlewareASGI, routes={}, server=MagicMock())
+
+            with TestClient(app) as client:
+                response = client.post("/api/free")
+
+        assert response.status_code == 200
+        mock_http_server_instance.has_routes_for_method.assert_called_with("POST")
+        mock_http_server_instance.requires_payment.assert_not_called()
+
+    def test_protected_route_goes_through_dispatch(self):
+        """Test that payment-protected routes are still handled by dispatch()."""
+        app = FastAPI()
+
+        @app.get("/api/protected")
+        def protected_route():
+            return {"data": "Protected content"}
+
+        with patch("x402.http.middleware.fastapi.x402HTTPResourceServer") as mock_http_server:
+            mock_http_server_instance = mock_http_server.return_value
+            mock_http_server_instance.requires_payment.return_value = True
+            mock_http_server_instance.initialize = MagicMock()
+            mock_http_server_instance.process_http_request = AsyncMock(
+                return_value=HTTPProcessResult(
+                    type="payment-error",
+                    response=HTTPResponseInstructions(
+                        status=402,
+                        headers={"PAYMENT-REQUIRED": "encoded"},
+                        body={},
+                    ),
+                )
+            )
+            app.add_middleware(PaymentMiddlewareASGI, routes={}, server=MagicMock())
+
+            with TestClient(app) as client:
+                response = client.get("/api/protected")
+
+        assert response.status_code == 402
+        assert response.headers["PAYMENT-REQUIRED"] == "encoded"
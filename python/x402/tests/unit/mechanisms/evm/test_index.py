@@ -126,6 +126,12 @@ class TestNormalizeAddress:
         with pytest.raises(ValueError, match="Invalid hex"):
             normalize_address("0x0123456789abcdef0123456789abcdefGHIJKLMN")
 
+    def test_should_keep_raising_for_repeated_invalid_address(self):
+        """Should not memoize failures for invalid addresses."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid address length"):
+                normalize_address("0x123")
+
 
 class TestGetEvmChainId:
     """Test get_evm_chain_id function (CAIP-2 only)."""
@@ -6,6 +6,8 @@ import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from eth_abi import encode
+
 from x402.mechanisms.evm.constants import (
     ERR_INSUFFICIENT_BALANCE,
     ERR_NETWORK_MISMATCH,
@@ -173,6 +175,24 @@ class MockFacilitatorSigner:
         return b""
 
 
+class MulticallFacilitatorSigner(MockFacilitatorSigner):
+    """Mock signer that also answers Multicall3 tryAggregate batches."""
+
+    def __init__(self, *, balance_reverts: bool = False, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._balance_reverts = balance_reverts
+        self.read_calls: list[str] = []
+
+    def read_contract(self, address: str, abi: list[dict], function_name: str, *args) -> Any:
+        self.read_calls.append(function_name)
+        if function_name == "tryAggregate":
+            return [
+                (True, encode(["uint256"], [self._allowance])),
+                (not self._balance_reverts, encode(["uint256"], [self._balance])),
+            ]
+        return super().read_contract(address, abi, function_name, *args)
+
+
 # ============================================================================
 # Type detection tests
 # ============================================================================
@@ -368,6 +388,26 @@ class TestVerifyPermit2:
         assert result.is_valid is False
         assert result.invalid_reason == ERR_INSUFFICIENT_BALANCE
 
+    def test_verify_reads_allowance_and_balance_in_one_multicall(self):
+        signer = MulticallFacilitatorSigner()
+        with patch(
+            "x402.mechanisms.evm.exact.permit2_utils._verify_permit2_signature",
+            return_value=True,
+        ):
+            result = self._verify(ExactEvmFacilitatorScheme(signer))
+        assert result.is_valid is True
+        assert signer.read_calls == ["tryAggregate"]
+
+    def test_verify_fails_closed_when_batched_balance_read_reverts(self):
+        signer = MulticallFacilitatorSigner(balance_reverts=True)
+        with patch(
+            "x402.mechanisms.evm.exact.permit2_utils._verify_permit2_signature",
+            return_value=True,
+        ):
+            result = self._verify(ExactEvmFacilitatorScheme(signer))
+        assert result.is_valid is False
+        assert result.invalid_reason == "balance_check_failed"
+
 
 # ============================================================================
 # Facilitator settle_permit2 tests
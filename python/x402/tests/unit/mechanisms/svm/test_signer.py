@@ -1,7 +1,14 @@
 """Tests for SVM signer implementations."""
 
+import base64
+
 import pytest
+from solders.hash import Hash
 from solders.keypair import Keypair
+from solders.message import Message, MessageV0, to_bytes_versioned
+from solders.null_signer import NullSigner
+from solders.system_program import TransferParams, transfer
+from solders.transaction import VersionedTransaction
 
 from x402.mechanisms.svm import SOLANA_DEVNET_CAIP2
 from x402.mechanisms.svm.signers import FacilitatorKeypairSigner, KeypairSigner
@@ -100,45 +107,32 @@ class TestFacilitatorKeypairSigner:
                 tx_base64, "UnknownAddress11111111111111111111", SOLANA_DEVNET_CAIP2
             )
 
-    def test_is_versioned_transaction_should_detect_legacy(self):
-        """_is_versioned_transaction should detect legacy transactions."""
-        keypair = Keypair()
-        signer = FacilitatorKeypairSigner(keypair)
-
-        # Legacy transaction: first byte of message < 128 (numRequiredSignatures = 1)
-        # Format: [sig_count_compact_u16] [signatures...] [message...]
-        # This is a minimal legacy transaction with 1 signature slot
-        # CompactU16(1) = 0x01, then 64 zero bytes for signature, then legacy message header
-        legacy_tx_bytes = bytes([0x01])  # 1 signature
-        legacy_tx_bytes += bytes(64)  # Empty signature
-        legacy_tx_bytes += bytes(
-            [0x01, 0x00, 0x00]
-        )  # Legacy header: numReqSigs=1, numReadonlySigned=0, numReadonlyUnsigned=0
-        legacy_tx_bytes += bytes([0x01])  # 1 account key
-        legacy_tx_bytes += bytes(32)  # Account key
-        legacy_tx_bytes += bytes(32)  # Recent blockhash
-        legacy_tx_bytes += bytes([0x00])  # 0 instructions
-
-        assert signer._is_versioned_transaction(legacy_tx_bytes) is False
-
-    def test_is_versioned_transaction_should_detect_versioned(self):
-        """_is_versioned_transaction should detect versioned (v0) transactions."""
-        keypair = Keypair()
-        signer = FacilitatorKeypairSigner(keypair)
+    @pytest.mark.parametrize("trailing", [b"", b"garbage"])
+    @pytest.mark.parametrize("versioned", [False, True])
+    def test_sign_transaction_should_add_valid_fee_payer_signature(self, versioned, trailing):
+        """sign_transaction should sign the message for legacy and v0 transactions."""
+        fee_payer = Keypair()
+        client = Keypair()
+        signer = FacilitatorKeypairSigner(fee_payer)
+
+        ix = transfer(
+            TransferParams(from_pubkey=client.pubkey(), to_pubkey=fee_payer.pubkey(), lamports=1)
+        )
+        if versioned:
+            message = MessageV0.try_compile(fee_payer.pubkey(), [ix], [], Hash.default())
+        else:
+            message = Message.new_with_blockhash([ix], fee_payer.pubkey(), Hash.default())
+        tx = VersionedTransaction(message, [NullSigner(fee_payer.pubkey()), client])
+        tx_base64 = base64.b64encode(bytes(tx) + trailing).decode("utf-8")
+
+        signed = VersionedTransaction.from_bytes(
+            base64.b64decode(
+                signer.sign_transaction(tx_base64, str(fee_payer.pubkey()), SOLANA_DEVNET_CAIP2)
+            )
+        )
 
-        # Versioned transaction: first byte of message >= 128 (0x80 for v0)
-        # Format: [sig_count_compact_u16] [signatures...] [version_byte] [message...]
-        versioned_tx_bytes = bytes([0x01])  # 1 signature
-        versioned_tx_bytes += bytes(64)  # Empty signature
-        versioned_tx_bytes += bytes([0x80])  # Version byte for v0 (128)
-        versioned_tx_bytes += bytes([0x01, 0x00, 0x00])  # Header
-        versioned_tx_bytes += bytes([0x01])  # 1 account key
-        versioned_tx_bytes += bytes(32)  # Account key
-        versioned_tx_bytes += bytes(32)  # Recent blockhash
-        versioned_tx_bytes += bytes([0x00])  # 0 instructions
-        versioned_tx_bytes += bytes([0x00])  # 0 address table lookups
-
-        assert signer._is_versioned_transaction(versioned_tx_bytes) is True
+        assert signed.signatures[1] == tx.signatures[1]
+        assert signed.signatures[0].verify(fee_payer.pubkey(), to_bytes_versioned(signed.message))
 
     def test_from_base58_with_single_key(self):
         """from_base58 should create signer from single base58 key."""